@@ -1,4 +1,3 @@
-import glob
 import json
 import os
 import os.path
@@ -15,11 +14,7 @@ class ShapeNetPartSegDataset(data.Dataset):
         self.root = root
         self.num_points = num_points
         self.split = split
-        all_obj_cats_file = os.path.join(self.root, "all_object_categories.txt")
-        fin = open(all_obj_cats_file, "r")
-        lines = [line.rstrip() for line in fin.readlines()]
-        self.all_obj_cats = [(line.split()[0], line.split()[1]) for line in lines]
-        fin.close()
+        self.all_obj_cats = read_object_categories(self.root)
 
         self.cat2id = {}
         id = 0
@@ -27,32 +22,41 @@ class ShapeNetPartSegDataset(data.Dataset):
             self.cat2id[cat] = id
             id += 1
         self.seg_classes = json.load(open(os.path.join(self.root, "cats2idpart.json"), "r"))
-        self.paths = []
         if self.split == "trainval":
-            for cat in self.cat2id:
-                self.paths += glob.glob("%s/train/%s/*points.txt" % (self.root, cat))
-            for cat in self.cat2id:
-                self.paths += glob.glob("%s/val/%s/*points.txt" % (self.root, cat))
-        elif self.split == "train":
-            for cat in self.cat2id:
-                self.paths += glob.glob("%s/train/%s/*points.txt" % (self.root, cat))
-        elif self.split == "test":
-            for cat in self.cat2id:
-                self.paths += glob.glob("%s/test/%s/*points.txt" % (self.root, cat))
+            splits = ["train", "val"]
+        elif self.split == "train" or self.split == "test":
+            splits = [self.split]
         else:
             print("Error: Mistake split")
             exit()
+        self.paths = []
+        self.packed = {}
+        self.packed_index = []
+        if all(is_packed_split(self.root, split) for split in splits):
+            # splits written by pack_split are memory-mapped once and sliced per sample
+            for split in splits:
+                paths, points, seg, offsets = load_packed_split(self.root, split)
+                self.packed[split] = (points, seg, offsets)
+                self.packed_index += [(split, i) for i in range(len(paths))]
+                self.paths += paths
+        else:
+            for split in splits:
+                self.paths += list_points_files(self.root, split, self.cat2id)
 
     def __getitem__(self, index):
         fnp = self.paths[index]
         cat = fnp.split("/")[-2]
         cls = self.cat2id[cat]
-        fns = fnp.replace("points", "seg")
-        points = np.loadtxt(fnp)
+        if self.packed:
+            split, i = self.packed_index[index]
+            points_all, seg_all, offsets = self.packed[split]
+            points = points_all[offsets[i] : offsets[i + 1]]
+            seg = seg_all[offsets[i] : offsets[i + 1]]
+        else:
+            points, seg = load_points_seg(fnp)
         points = points - np.expand_dims(np.mean(points, axis=0), 0)  # center
         dist = np.max(np.sqrt(np.sum(points**2, axis=1)), 0)
         points = points / dist  # scale
-        seg = np.loadtxt(fns)
         points = torch.from_numpy(points.astype(np.float32))
         cls = torch.from_numpy(np.array([cls]).astype(np.int64))
         seg = torch.from_numpy(seg.astype(np.int64))
@@ -62,12 +66,102 @@ class ShapeNetPartSegDataset(data.Dataset):
         return len(self.paths)
 
 
+def list_points_files(folder_path, split, cats):
+    """List the *points.txt files of a split, grouped by category in the order of cats.
+
+    os.scandir reads each category folder once instead of pattern-matching every entry like glob.
+    """
+    paths = []
+    for cat in cats:
+        cat_dir = "%s/%s/%s" % (folder_path, split, cat)
+        try:
+            with os.scandir(cat_dir) as entries:
+                paths += ["%s/%s" % (cat_dir, entry.name) for entry in entries if entry.name.endswith("points.txt")]
+        except FileNotFoundError:
+            continue
+    return paths
+
+
+def read_object_categories(folder_path):
+    """Read all_object_categories.txt as a list of (category, offset) pairs, splitting each line once."""
+    with open(os.path.join(folder_path, "all_object_categories.txt"), "r") as fin:
+        return [tuple(line.split()[:2]) for line in fin if line.strip()]
+
+
+def load_points_seg(path_points):
+    """Load points and part labels of a sample, preferring the .npy files written by convert_to_npy."""
+    path_seg = path_points.replace("points", "seg")
+    path_points_npy = os.path.splitext(path_points)[0] + ".npy"
+    path_seg_npy = os.path.splitext(path_seg)[0] + ".npy"
+    if os.path.exists(path_points_npy) and os.path.exists(path_seg_npy):
+        return np.load(path_points_npy), np.load(path_seg_npy)
+    return np.loadtxt(path_points), np.loadtxt(path_seg)
+
+
+def convert_to_npy(folder_path="shapenet_part_hdf5_data"):
+    """Convert the *points.txt / *seg.txt files produced by convert_data to .npy siblings.
+
+    np.loadtxt tokenizes every sample in Python on each epoch, np.load only reads raw bytes.
+    """
+    cats = [cat for (cat, off) in read_object_categories(folder_path)]
+    paths = []
+    for split in ["train", "val", "test"]:
+        paths += list_points_files(folder_path, split, cats)
+    for path_points in paths:
+        path_seg = path_points.replace("points", "seg")
+        np.save(os.path.splitext(path_points)[0] + ".npy", np.loadtxt(path_points).astype(np.float32))
+        np.save(os.path.splitext(path_seg)[0] + ".npy", np.loadtxt(path_seg).astype(np.int64))
+
+
+def pack_split(folder_path="shapenet_part_hdf5_data", split="train"):
+    """Concatenate all samples of a split into flat points/seg binaries plus per-sample offsets.
+
+    Writes <split>_points.f32.bin ([N_total, 3] float32), <split>_seg.i32.bin ([N_total] int32),
+    <split>_offsets.npy (sample i spans offsets[i]:offsets[i + 1]) and <split>_paths.txt.
+    """
+    cats = [cat for (cat, off) in read_object_categories(folder_path)]
+    # same per-category order as the unpacked dataset, so indices map to the same samples
+    paths = list_points_files(folder_path, split, cats)
+    if not paths:
+        raise ValueError("No *points.txt files found for split '%s' in %s" % (split, folder_path))
+    # offsets are removed first and written last, so an interrupted run leaves the split unpacked
+    path_offsets = "%s/%s_offsets.npy" % (folder_path, split)
+    if os.path.exists(path_offsets):
+        os.remove(path_offsets)
+    points_list = []
+    seg_list = []
+    for path_points in paths:
+        points, seg = load_points_seg(path_points)
+        points_list.append(points)
+        seg_list.append(seg)
+    offsets = np.zeros(len(paths) + 1, dtype=np.int64)
+    offsets[1:] = np.cumsum([len(points) for points in points_list])
+    np.concatenate(points_list, 0).astype(np.float32).tofile("%s/%s_points.f32.bin" % (folder_path, split))
+    np.concatenate(seg_list, 0).astype(np.int32).tofile("%s/%s_seg.i32.bin" % (folder_path, split))
+    with open("%s/%s_paths.txt" % (folder_path, split), "w") as f:
+        for path_points in paths:
+            f.write(os.path.relpath(path_points, folder_path) + "\n")
+    np.save(path_offsets, offsets)
+
+
+def is_packed_split(folder_path, split):
+    """Check that all the files written by pack_split exist for split."""
+    suffixes = ["points.f32.bin", "seg.i32.bin", "paths.txt", "offsets.npy"]
+    return all(os.path.exists("%s/%s_%s" % (folder_path, split, suffix)) for suffix in suffixes)
+
+
+def load_packed_split(folder_path, split):
+    """Memory-map the files written by pack_split, returns (paths, points, seg, offsets)."""
+    with open("%s/%s_paths.txt" % (folder_path, split), "r") as f:
+        paths = ["%s/%s" % (folder_path, line.rstrip()) for line in f]
+    points = np.memmap("%s/%s_points.f32.bin" % (folder_path, split), dtype=np.float32, mode="r").reshape(-1, 3)
+    seg = np.memmap("%s/%s_seg.i32.bin" % (folder_path, split), dtype=np.int32, mode="r")
+    offsets = np.load("%s/%s_offsets.npy" % (folder_path, split))
+    return paths, points, seg, offsets
+
+
 def convert_data(folder_path="shapenet_part_hdf5_data"):
-    all_obj_cats_file = os.path.join(folder_path, "all_object_categories.txt")
-    fin = open(all_obj_cats_file, "r")
-    lines = [line.rstrip() for line in fin.readlines()]
-    all_obj_cats = [(line.split()[0], line.split()[1]) for line in lines]
-    fin.close()
+    all_obj_cats = read_object_categories(folder_path)
     cat2id = {}
     id2cat = {}
     off2cat = {}
@@ -2,6 +2,7 @@ import os
 
 import h5py
 import numpy as np
+from numpy.lib.recfunctions import structured_to_unstructured
 from plyfile import PlyData, PlyElement
 
 
@@ -116,7 +117,7 @@ def load_h5(h5_filename):
 def load_ply_data(filename, point_num):
     plydata = PlyData.read(filename)
     pc = plydata["vertex"].data[:point_num]
-    pc_array = np.array([[x, y, z] for x, y, z in pc])
+    pc_array = np.array(structured_to_unstructured(pc[["x", "y", "z"]]))
     return pc_array
 
 
@@ -124,7 +125,7 @@ def load_ply_data(filename, point_num):
 def load_ply_normal(filename, point_num):
     plydata = PlyData.read(filename)
     pc = plydata["normal"].data[:point_num]
-    pc_array = np.array([[x, y, z] for x, y, z in pc])
+    pc_array = np.array(structured_to_unstructured(pc))
     return pc_array
 
 
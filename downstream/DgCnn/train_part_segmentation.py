@@ -12,7 +12,7 @@ from models import DGCNN_part_seg, get_loss
 from torch.optim.lr_scheduler import CosineAnnealingLR, StepLR
 from torch.utils.tensorboard import SummaryWriter
 from tqdm import tqdm
-from utils import copy_parameters, to_one_hot
+from utils import copy_parameters, fast_hist, to_one_hot
 
 
 def parse_args():
@@ -179,15 +179,14 @@ def train():
     # test
     with torch.no_grad():
         test_metrics = {}
-        total_correct = 0
-        total_seen = 0
-        total_seen_class = [0 for _ in range(num_part_classes)]
-        total_correct_class = [0 for _ in range(num_part_classes)]
+        hist = np.zeros((num_part_classes, num_part_classes), dtype=np.int64)
         shape_ious = {cat: [] for cat in seg_classes.keys()}
         seg_label_to_cat = {}  # {0:Airplane, 1:Airplane, ...49:Table}
+        seg_label_to_parts = np.zeros((num_part_classes, num_part_classes), dtype=bool)  # parts of the same category
         for cat in seg_classes.keys():
             for label in seg_classes[cat]:
                 seg_label_to_cat[label] = cat
+                seg_label_to_parts[label, seg_classes[cat]] = True
         classifier.eval()
         for batch_id, (points, label, target) in tqdm(enumerate(testdataloader)):
             cur_batch_size, NUM_POINT, _ = points.size()
@@ -200,19 +199,11 @@ def train():
             cur_pred_val = seg_pred.cpu().data.numpy()
 
             cur_pred_val_logits = cur_pred_val
-            cur_pred_val = np.zeros((cur_batch_size, NUM_POINT)).astype(np.int32)
             target = target.cpu().data.numpy()
-            for i in range(cur_batch_size):
-                cat = seg_label_to_cat[target[i, 0]]
-                logits = cur_pred_val_logits[i, :, :]
-                cur_pred_val[i, :] = np.argmax(logits[:, seg_classes[cat]], 1) + seg_classes[cat][0]
-            correct = np.sum(cur_pred_val == target)
-            total_correct += correct
-            total_seen += cur_batch_size * NUM_POINT
-
-            for l in range(num_part_classes):
-                total_seen_class[l] += np.sum(target == l)
-                total_correct_class[l] += np.sum((cur_pred_val == l) & (target == l))
+            # only the parts of each shape's category can be predicted
+            parts = seg_label_to_parts[target[:, 0]][:, np.newaxis, :]
+            cur_pred_val = np.argmax(np.where(parts, cur_pred_val_logits, -np.inf), 2).astype(np.int32)
+            hist += fast_hist(cur_pred_val, target, num_part_classes)
 
             for i in range(cur_batch_size):
                 segp = cur_pred_val[i, :]
@@ -236,10 +227,8 @@ def train():
                 all_shape_ious.append(iou)
             shape_ious[cat] = np.mean(shape_ious[cat])
         mean_shape_ious = np.mean(list(shape_ious.values()))
-        test_metrics["accuracy"] = total_correct / float(total_seen)
-        test_metrics["class_avg_accuracy"] = np.mean(
-            np.array(total_correct_class) / np.array(total_seen_class, dtype=np.float)
-        )
+        test_metrics["accuracy"] = np.diag(hist).sum() / float(hist.sum())
+        test_metrics["class_avg_accuracy"] = np.mean(np.diag(hist) / hist.sum(1).astype(np.float64))
         for cat in sorted(shape_ious.keys()):
             print("eval mIoU of %s %f" % (cat + " " * (14 - len(cat)), shape_ious[cat]))
         test_metrics["each mIoU"] = shape_ious
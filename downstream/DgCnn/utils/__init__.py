@@ -1,4 +1,4 @@
-from .utils import calculate_sem_IoU, copy_parameters, to_one_hot
+from .utils import calculate_sem_IoU, copy_parameters, fast_hist, to_one_hot
 
 
-__all__ = ["calculate_sem_IoU", "copy_parameters", "to_one_hot"]
+__all__ = ["calculate_sem_IoU", "copy_parameters", "fast_hist", "to_one_hot"]
@@ -35,13 +35,14 @@ def to_one_hot(y, num_class):
     return new_y
 
 
+def fast_hist(pred_np, seg_np, num_classes):
+    """Confusion matrix of the flattened labels, hist[gt, pred] counts the points of class gt predicted as pred."""
+    index = num_classes * seg_np.reshape(-1).astype(np.int64) + pred_np.reshape(-1)
+    return np.bincount(index, minlength=num_classes**2).reshape(num_classes, num_classes)
+
+
 def calculate_sem_IoU(pred_np, seg_np):
-    I_all = np.zeros(13)
-    U_all = np.zeros(13)
-    for sem_idx in range(seg_np.shape[0]):
-        for sem in range(13):
-            I = np.sum(np.logical_and(pred_np[sem_idx] == sem, seg_np[sem_idx] == sem))
-            U = np.sum(np.logical_or(pred_np[sem_idx] == sem, seg_np[sem_idx] == sem))
-            I_all[sem] += I
-            U_all[sem] += U
+    hist = fast_hist(pred_np, seg_np, 13)
+    I_all = np.diag(hist)
+    U_all = hist.sum(0) + hist.sum(1) - I_all
     return I_all / U_all
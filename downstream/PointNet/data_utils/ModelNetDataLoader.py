@@ -18,17 +18,17 @@ class ModelNetDataset_H5PY(data.Dataset):
     def __init__(self, filelist, num_point=1024, data_augmentation=False):
         self.num_point = num_point
         self.file_list = [item.strip() for item in open(filelist).readlines()]
-        self.points_list = np.zeros((1, num_point, 3))
-        self.labels_list = np.zeros((1,))
         self.data_augmentation = data_augmentation
         self.num_classes = 40
+        points_list = []
+        labels_list = []
         for file in self.file_list:
             data, label = self.loadh5DataFile(file)
-            self.points_list = np.concatenate([self.points_list, data[:, : self.num_point, :]], axis=0)
-            self.labels_list = np.concatenate([self.labels_list, label.ravel()], axis=0)
-
-        self.points_list = self.points_list[1:]
-        self.labels_list = self.labels_list[1:]
+            points_list.append(data[:, : self.num_point, :])
+            labels_list.append(label.ravel())
+        # concatenate once instead of regrowing the arrays for every file
+        self.points_list = np.concatenate(points_list, axis=0)
+        self.labels_list = np.concatenate(labels_list, axis=0)
         assert len(self.points_list) == len(self.labels_list)
         print("Number of Objects: ", len(self.labels_list))
 
@@ -25,8 +25,8 @@ class ScanObjectNNDataset(data.Dataset):
             f = h5py.File("%s/%s" % (self.root, "test_objectdataset.h5"), "r")
             self.data = f["data"][:]
             self.label = f["label"][:]
-        labels = list(set(self.label))
-        self.classes = dict(zip(sorted(labels), range(len(labels))))
+        labels = np.unique(self.label)
+        self.classes = dict(zip(labels, range(len(labels))))
         self.num_classes = len(labels)
 
     def __getitem__(self, index):
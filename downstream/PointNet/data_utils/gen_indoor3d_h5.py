@@ -1,4 +1,5 @@
 # Ref https://github.com/charlesq34/pointnet/blob/master/sem_seg/gen_indoor3d_h5.py
+import multiprocessing
 import os
 
 import data_prep_util
@@ -25,7 +26,6 @@ if not os.path.exists(output_dir):
     os.mkdir(output_dir)
 output_filename_prefix = os.path.join(output_dir, "ply_data_all")
 output_room_filelist = os.path.join(output_dir, "room_filelist.txt")
-fout_room = open(output_room_filelist, "w")
 
 # --------------------------------------
 # ----- BATCH WRITE TO HDF5 -----
@@ -72,18 +72,28 @@ def insert_batch(data, label, last_batch=False):
     return
 
 
-sample_cnt = 0
-for i, data_label_filename in enumerate(data_label_files):
-    print(data_label_filename)
-    data, label = indoor3d_util.room2blocks_wrapper_normalized(
+def room2blocks(data_label_filename):
+    # pool workers inherit the same numpy random state, reseed so each room samples its blocks independently
+    np.random.seed()
+    return indoor3d_util.room2blocks_wrapper_normalized(
         data_label_filename, NUM_POINT, block_size=1.0, stride=0.5, random_sample=False, sample_num=None
     )
-    print("{0}, {1}".format(data.shape, label.shape))
-    for _ in range(data.shape[0]):
-        fout_room.write(os.path.basename(data_label_filename)[0:-4] + "\n")
 
-    sample_cnt += data.shape[0]
-    insert_batch(data, label, i == len(data_label_files) - 1)
 
-fout_room.close()
-print("Total samples: {0}".format(sample_cnt))
+if __name__ == "__main__":
+    fout_room = open(output_room_filelist, "w")
+    sample_cnt = 0
+    # rooms are blocked in parallel, imap yields them in file order so the h5 layout is unchanged
+    with multiprocessing.Pool() as pool:
+        for i, (data, label) in enumerate(pool.imap(room2blocks, data_label_files)):
+            data_label_filename = data_label_files[i]
+            print(data_label_filename)
+            print("{0}, {1}".format(data.shape, label.shape))
+            for _ in range(data.shape[0]):
+                fout_room.write(os.path.basename(data_label_filename)[0:-4] + "\n")
+
+            sample_cnt += data.shape[0]
+            insert_batch(data, label, i == len(data_label_files) - 1)
+
+    fout_room.close()
+    print("Total samples: {0}".format(sample_cnt))
@@ -138,23 +138,16 @@ def room2blocks_plus_normalized(data_label, num_point, block_size, stride, rando
     data = data_label[:, 0:6]
     data[:, 3:6] /= 255.0
     label = data_label[:, -1].astype(np.uint8)
-    max_room_x = max(data[:, 0])
-    max_room_y = max(data[:, 1])
-    max_room_z = max(data[:, 2])
+    max_room = np.max(data[:, 0:3], axis=0)
 
     data_batch, label_batch = room2blocks(
         data, label, num_point, block_size, stride, random_sample, sample_num, sample_aug
     )
-    new_data_batch = np.zeros((data_batch.shape[0], num_point, 9))
-    for b in range(data_batch.shape[0]):
-        new_data_batch[b, :, 6] = data_batch[b, :, 0] / max_room_x
-        new_data_batch[b, :, 7] = data_batch[b, :, 1] / max_room_y
-        new_data_batch[b, :, 8] = data_batch[b, :, 2] / max_room_z
-        minx = min(data_batch[b, :, 0])
-        miny = min(data_batch[b, :, 1])
-        data_batch[b, :, 0] -= minx + block_size / 2
-        data_batch[b, :, 1] -= miny + block_size / 2
+    # fill all blocks at once, 678 are the room-normalized XYZ and XY are centered on each block
+    new_data_batch = np.empty((data_batch.shape[0], num_point, 9))
     new_data_batch[:, :, 0:6] = data_batch
+    np.divide(data_batch[:, :, 0:3], max_room, out=new_data_batch[:, :, 6:9])
+    new_data_batch[:, :, 0:2] -= np.min(data_batch[:, :, 0:2], axis=1, keepdims=True) + block_size / 2
     return new_data_batch, label_batch
 
 
@@ -217,22 +210,12 @@ def room2samples_plus_normalized(data_label, num_point):
     data = data_label[:, 0:6]
     data[:, 3:6] /= 255.0
     label = data_label[:, -1].astype(np.uint8)
-    max_room_x = max(data[:, 0])
-    max_room_y = max(data[:, 1])
-    max_room_z = max(data[:, 2])
-    # print(max_room_x, max_room_y, max_room_z)
+    max_room = np.max(data[:, 0:3], axis=0)
 
     data_batch, label_batch = room2samples(data, label, num_point)
-    new_data_batch = np.zeros((data_batch.shape[0], num_point, 9))
-    for b in range(data_batch.shape[0]):
-        new_data_batch[b, :, 6] = data_batch[b, :, 0] / max_room_x
-        new_data_batch[b, :, 7] = data_batch[b, :, 1] / max_room_y
-        new_data_batch[b, :, 8] = data_batch[b, :, 2] / max_room_z
-        # minx = min(data_batch[b, :, 0])
-        # miny = min(data_batch[b, :, 1])
-        # data_batch[b, :, 0] -= (minx+block_size/2)
-        # data_batch[b, :, 1] -= (miny+block_size/2)
+    new_data_batch = np.empty((data_batch.shape[0], num_point, 9))
     new_data_batch[:, :, 0:6] = data_batch
+    np.divide(data_batch[:, :, 0:3], max_room, out=new_data_batch[:, :, 6:9])
     return new_data_batch, label_batch
 
 
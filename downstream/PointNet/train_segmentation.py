@@ -11,7 +11,7 @@ from data_utils import S3DISDataset
 from models import PointNet_seg, get_loss
 from torch.utils.tensorboard import SummaryWriter
 from tqdm import tqdm
-from utils import bn_momentum_adjust, copy_parameters, init_weights, init_zeros
+from utils import bn_momentum_adjust, copy_parameters, fast_hist, init_weights, init_zeros
 
 
 def parse_args():
@@ -146,15 +146,10 @@ def train():
     torch.save(classifier.state_dict(), "%s/seg_model.pth" % (path_checkpoints))
     # benchmark mIOU
     with torch.no_grad():
-        total_correct = 0.0
-        total_seen = 0.0
-        total_seen_class = [0 for _ in range(num_classes)]
-        total_correct_class = [0 for _ in range(num_classes)]
-        total_iou_deno_class = [0 for _ in range(num_classes)]
+        hist = np.zeros((num_classes, num_classes), dtype=np.int64)
         classifier = classifier.eval()
         for i, data in tqdm(enumerate(testdataloader, 0)):
             points, target = data
-            BATCH_SIZE = points.size()[0]
             points, target = points.cuda(), target.cuda()
 
             seg_pred, _, _ = classifier(points)
@@ -162,21 +157,18 @@ def train():
 
             pred_val = pred_choice.cpu().data.numpy()
             batch_label = target.cpu().data.numpy()
-            correct = np.sum((pred_val == batch_label))
-            total_correct += correct
-            total_seen += BATCH_SIZE * args.num_point
-            for l in range(num_classes):
-                total_seen_class[l] += np.sum((batch_label == l))
-                total_correct_class[l] += np.sum((pred_val == l) & (batch_label == l))
-                total_iou_deno_class[l] += np.sum(((pred_val == l) | (batch_label == l)))
+            hist += fast_hist(pred_val, batch_label, num_classes)
             # break
-        mIoU = np.mean(np.array(total_correct_class) / (np.array(total_iou_deno_class, dtype=np.float) + 1e-6))
+        total_correct_class = np.diag(hist)
+        total_seen_class = hist.sum(1)
+        total_iou_deno_class = hist.sum(0) + hist.sum(1) - total_correct_class
+        total_correct = total_correct_class.sum()
+        total_seen = hist.sum()
+        mIoU = np.mean(total_correct_class / (total_iou_deno_class + 1e-6))
         test_metrics = {}
         test_metrics["mIoU"] = mIoU
         test_metrics["mAcc"] = total_correct / total_seen
-        test_metrics["mcAcc"] = np.mean(
-            np.array(total_correct_class) / (np.array(total_seen_class, dtype=np.float) + 1e-6)
-        )
+        test_metrics["mcAcc"] = np.mean(total_correct_class / (total_seen_class + 1e-6))
         print("mIOU : {}, avg acc: {}".format(mIoU, total_correct / total_seen))
         with open("%s/test_block_area.json" % path_logs, "w") as json_file:
             json.dump(test_metrics, json_file)
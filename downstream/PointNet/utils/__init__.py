@@ -1,4 +1,4 @@
-from .utils import bn_momentum_adjust, copy_parameters, init_weights, init_zeros, to_one_hot
+from .utils import bn_momentum_adjust, copy_parameters, fast_hist, init_weights, init_zeros, to_one_hot
 
 
-__all__ = ["bn_momentum_adjust", "copy_parameters", "init_weights", "init_zeros", "to_one_hot"]
+__all__ = ["bn_momentum_adjust", "copy_parameters", "fast_hist", "init_weights", "init_zeros", "to_one_hot"]
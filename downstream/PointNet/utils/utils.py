@@ -1,5 +1,6 @@
 # Ref https://github.com/AnTao97/dgcnn.pytorch/blob/master/util.py
 # Ref https://github.com/hansen7/OcCo/blob/master/OcCo_Torch/utils/Torch_Utility.py
+import numpy as np
 import torch
 import torch.nn as nn
 
@@ -81,6 +82,12 @@ def to_one_hot(y, num_class):
     return new_y
 
 
+def fast_hist(pred_np, seg_np, num_classes):
+    """Confusion matrix of the flattened labels, hist[gt, pred] counts the points of class gt predicted as pred."""
+    index = num_classes * seg_np.reshape(-1).astype(np.int64) + pred_np.reshape(-1)
+    return np.bincount(index, minlength=num_classes**2).reshape(num_classes, num_classes)
+
+
 def init_weights(m):
     if isinstance(m, nn.Conv1d) or isinstance(m, nn.Linear) or isinstance(m, nn.Conv2d):
         torch.nn.init.xavier_uniform_(m.weight)
@@ -112,20 +112,20 @@ class ModelNetSSLDataset(data.Dataset):
         for i in range(self.num_views):
             fpp = "%s/pix_point_%s.txt" % (folder_mv, views[i])
             indi = np.loadtxt(fpp, dtype=np.int32)
-            indi = np.hstack((np.ones((indi.shape[0], 1), dtype=np.int32) * i, indi))
+            indi = np.hstack((np.full((indi.shape[0], 1), i, dtype=np.int32), indi))
             list_id2pix.append(indi)
         list_id2pix = np.concatenate(list_id2pix, 0)
 
-        # create dict map point to list pixel
+        # create dict map point to list pixel, points keep the order of their first pair
+        point_ids, first_pair, inverse, num_pairs = np.unique(
+            list_id2pix[:, 3], return_index=True, return_inverse=True, return_counts=True
+        )
+        pairs_by_point = np.split(np.argsort(inverse, kind="stable"), np.cumsum(num_pairs)[:-1])
         dict_pair = {}
-        for i in range(len(list_id2pix)):
-            point_id = list_id2pix[i][3]
-            if point_id not in dict_pair:
-                dict_pair[point_id] = []
-            dict_pair[point_id].append(i)
-        # shuffle pixel
-        for k in dict_pair.keys():
-            np.random.shuffle(dict_pair[k])
+        for k in np.argsort(first_pair):
+            # shuffle pixel
+            np.random.shuffle(pairs_by_point[k])
+            dict_pair[point_ids[k]] = pairs_by_point[k].tolist()
 
         if self.fps == "fps":
             # furthest sampling pair
@@ -65,7 +65,7 @@ def farthest_pair_sample(point, dict_pair, num_pair=512):
     N = len(point_id)
     xyz = point[point_id]
     centroids = np.zeros((num_pair,))
-    distance = np.ones((N,)) * 1e10
+    distance = np.full((N,), 1e10)
     farthest = np.random.randint(0, N)
     id = 0
     list_id = []
@@ -97,7 +97,7 @@ def separate_point_sample(point, dict_pair, num_pair=512):
     if N > num_pair:
         # print('fps')
         centroids = np.zeros((num_pair,))
-        distance = np.ones((N,)) * 1e10
+        distance = np.full((N,), 1e10)
         farthest = np.random.randint(0, N)
         id = 0
         list_id = []
@@ -140,10 +140,8 @@ def farthest_point_sample(point, npoint=1024):
     N, D = point.shape
     xyz = point[:, :3]
     centroids = np.zeros((npoint,))
-    distance = np.ones((N,)) * 1e10
+    distance = np.full((N,), 1e10)
     farthest = np.random.randint(0, N)
-    fo = farthest
-    print(fo)
     for i in range(npoint):
         centroids[i] = farthest
         centroid = xyz[farthest, :]